@@ -1,10 +1,14 @@
 """ CRSF protocol implementation for ExpressLRS devices """
 
 import time
+import struct
 from enum import Enum, auto
 from typing import Dict, Any
 import serial
 
+# Per-frame telemetry prints (battery, RX channels), off so the RX path skips the formatting
+DEBUG = False
+
 class ConnectionState(Enum):
     """Connection state for CRSF device"""
     DISCONNECTED = auto()
@@ -29,39 +33,82 @@ class ParamType(Enum):
     COMMAND = 13
     OUT_OF_RANGE = 127
 
+def _crc8_d5_entry(value: int) -> int:
+    """Bit-serial CRC8 (poly 0xD5) of a single byte, used to build the lookup table"""
+    crc = value
+    for _ in range(8):
+        if crc & 0x80:
+            crc = (crc << 1) ^ 0xD5
+        else:
+            crc = crc << 1
+        crc &= 0xFF
+    return crc
+
+# CRC8 lookup table for the CRSF polynomial, built once at import
+_CRC8_D5 = bytes(_crc8_d5_entry(i) for i in range(256))
+
+# CRC of the RC_CHANNELS_PACKED type byte, the payload CRC continues from here
+_RC_TYPE_CRC = _CRC8_D5[0x16]
+
+# 16 channels * 11 bits of RC channel payload
+_RC_PAYLOAD_MASK = (1 << 176) - 1
+# Bit offset of each channel inside the packed payload
+_RC_SHIFTS = tuple(11 * i for i in range(16))
+
+# Sync/address bytes accepted at the start of an RX frame
+_VALID_SYNC = frozenset((0x00, 0xEA, 0x0C, 0xC8))
+
+def _cstr(data: bytearray, idx: int):
+    """Decode the null-terminated string at idx, returns (string, index past the terminator)"""
+    end = data.index(0, idx)
+    return data[idx:end].decode('latin-1'), end + 1
+
+# Fixed telemetry payload layouts, unpacked straight from the frame (offset 3)
+_BATTERY_SENSOR = struct.Struct('>HHI')  # voltage, current, capacity (24 bit) + remaining
+_LINK_STATISTICS = struct.Struct('>10B')
+# OpenTX sync payload after the subtype byte: interval (0.1us), phase (us)
+_OPENTX_SYNC = struct.Struct('>Ii')
+# Device info fields after the name: serial, hw version, sw version, param count, protocol
+_DEVICE_INFO = struct.Struct('<4sIIBB')
+# Float parameter: value, min, max, default, decimal point, step size
+_PARAM_FLOAT = struct.Struct('<iiiiBi')
+
 class CRSFParser:
     """CRSF packet parser"""
     @staticmethod
     def crc8(data: bytearray) -> int:
-        """CRC8 calculation for CRSF packets"""
+        """CRC8 calculation for CRSF packets, skips the sync and length bytes"""
         crc = 0
-        for byte in data[2:]:
-            crc ^= byte
-            for _ in range(8):
-                if crc & 0x80:
-                    crc = (crc << 1) ^ 0xD5
-                else:
-                    crc = crc << 1
-            crc &= 0xFF
+        tbl = _CRC8_D5
+        # memoryview slice avoids copying the packet
+        for byte in memoryview(data)[2:]:
+            crc = tbl[crc ^ byte]
+        return crc
+
+    @staticmethod
+    def crc8_update(crc: int, data) -> int:
+        """Continue a CRC8 over data, for frames whose fixed leading bytes are already folded into crc"""
+        tbl = _CRC8_D5
+        for byte in data:
+            crc = tbl[crc ^ byte]
         return crc
 
     @staticmethod
     def parse_device_info(data: bytearray) -> Dict[str, Any]:
         """Device info"""
-        idx = 0
-        name = ""
-        while data[idx] != 0:
-            name += chr(data[idx])
-            idx += 1
-        idx += 1
+        # [sync] [len] [type] [dest] [origin] [name\0] [serial] [hw] [sw] [count] [proto]
+        # Single C-level scan for the name's null terminator
+        name, idx = _cstr(data, 5)
+        serial_no, hw_version, sw_version, param_count, protocol_version = \
+            _DEVICE_INFO.unpack_from(data, idx)
 
         return {
             "name": name,
-            "serial": data[idx:idx+4].decode(),
-            "hw_version": int.from_bytes(data[idx+4:idx+8], 'little'),
-            "sw_version": int.from_bytes(data[idx+8:idx+12], 'little'),
-            "param_count": data[idx+12],
-            "protocol_version": data[idx+13]
+            "serial": serial_no.decode(),
+            "hw_version": hw_version,
+            "sw_version": sw_version,
+            "param_count": param_count,
+            "protocol_version": protocol_version
         }
 
     @staticmethod
@@ -87,18 +134,17 @@ class CRSFParser:
             raise ValueError(f"Unsupported param type: {param_type}")
 
         # Parse current value, min value, max value
-        current_value = int.from_bytes(data[idx:idx + size], 'big', signed=(param_type % 2 == 1))
+        from_bytes = int.from_bytes
+        signed = param_type % 2 == 1
+        current_value = from_bytes(data[idx:idx + size], 'big', signed=signed)
         idx += size
-        min_value = int.from_bytes(data[idx:idx + size], 'big', signed=(param_type % 2 == 1))
+        min_value = from_bytes(data[idx:idx + size], 'big', signed=signed)
         idx += size
-        max_value = int.from_bytes(data[idx:idx + size], 'big', signed=(param_type % 2 == 1))
+        max_value = from_bytes(data[idx:idx + size], 'big', signed=signed)
         idx += size
 
         # Parse the null-terminated unit string
-        unit = ""
-        while data[idx] != 0:
-            unit += chr(data[idx])
-            idx += 1
+        unit, _ = _cstr(data, idx)
 
         return {
             "current_value": current_value,
@@ -112,33 +158,20 @@ class CRSFParser:
         """
         Parse the float type from a parameter packet
         """
-        idx = 0
-        value = int.from_bytes(data[idx:idx + 4], 'little', signed=True)
-        idx += 4
-        min_value = int.from_bytes(data[idx:idx + 4], 'little', signed=True)
-        idx += 4
-        max_value = int.from_bytes(data[idx:idx + 4], 'little', signed=True)
-        idx += 4
-        default_value = int.from_bytes(data[idx:idx + 4], 'little', signed=True)
-        idx += 4
-        decimal_point = data[idx]
-        idx += 1
-        step_size = int.from_bytes(data[idx:idx + 4], 'little', signed=True)
-        idx += 4
+        value, min_value, max_value, default_value, decimal_point, step_size = \
+            _PARAM_FLOAT.unpack_from(data, 0)
 
         # Parse the null-terminated unit string
-        unit = ""
-        while data[idx] != 0:
-            unit += chr(data[idx])
-            idx += 1
+        unit, _ = _cstr(data, _PARAM_FLOAT.size)
 
+        scale = 10 ** decimal_point
         return {
-            "value": value / (10 ** decimal_point),
-            "min": min_value / (10 ** decimal_point),
-            "max": max_value / (10 ** decimal_point),
-            "default": default_value / (10 ** decimal_point),
+            "value": value / scale,
+            "min": min_value / scale,
+            "max": max_value / scale,
+            "default": default_value / scale,
             "decimal_point": decimal_point,
-            "step_size": step_size / (10 ** decimal_point),
+            "step_size": step_size / scale,
             "unit": unit
         }
 
@@ -156,22 +189,10 @@ class CRSFParser:
         idx = 0
 
         if data[idx]:
-            # Parse the null-terminated options string
-            while idx-1 < len(data) and data[idx] and data[idx] != 0:
-                options += chr(data[idx])
-                idx += 1
-
-            # Move past options, then parse value, min, max, default, and unit
-            idx += 1
-            value = data[idx]
-            idx += 1
-            min_value = data[idx]
-            idx += 1
-            max_value = data[idx]
-            idx += 1
-            default_value = data[idx]
-            idx += 1
-            unit = data[idx:].decode()
+            # Parse the null-terminated options string, then value, min, max, default, and unit
+            options, idx = _cstr(data, idx)
+            value, min_value, max_value, default_value = data[idx:idx + 4]
+            unit, _ = _cstr(data, idx + 4)
 
         return {
             "options": options.split(';'),
@@ -187,12 +208,7 @@ class CRSFParser:
         """
         Parse the string type from a parameter packet
         """
-        value = ""
-        idx = 0
-        while data[idx] != 0:
-            value += chr(data[idx])
-            idx += 1
-        idx += 1
+        value, idx = _cstr(data, 0)
         string_max_length = data[idx]
 
         return {
@@ -207,19 +223,13 @@ class CRSFParser:
         TBS spec says list of children
         crsf-wg spec says string display name...
         """
-        list_of_children = ""
-        idx = 0
-
         # Some folders are empty, don't run off the end
-        if len(data[idx:]) < 2:
+        if len(data) < 2:
             return {
                 "list_of_children": []
             }
 
-        while data[idx] != 0:
-            list_of_children += chr(data[idx])
-            idx += 1
-        idx += 1
+        list_of_children, _ = _cstr(data, 0)
 
         return {
             "list_of_children": list_of_children.split(';')
@@ -265,22 +275,13 @@ class CRSFParser:
         """
         idx = 0
         parent_folder = data[idx]
-
-        # Workaround for issue w/ rp3's data?
-        if parent_folder == '\t':
-            parent_folder = 0
         idx += 1
 
         data_type = data[idx]
         idx += 1
 
-        # Parse the null-terminated name string
-        name = ""
-        while data[idx] != 0:
-            name += chr(data[idx])
-            idx += 1
-
-        idx += 1  # Move past the null terminator
+        # Parse the null-terminated name string, idx ends past the terminator
+        name, idx = _cstr(data, idx)
 
         return {
             "parent_folder": parent_folder,
@@ -298,35 +299,49 @@ class CRSFParser:
         param_payload = payload[param_info["chunk_header"]["idx"]:]
         pkt_type = param_info["chunk_header"]["type"]
 
-        if pkt_type < ParamType.FLOAT.value:
+        parser = _PARAM_PARSERS.get(pkt_type)
+        if parser is not None:
+            param_info["chunk"] = parser(param_payload)
+
+        elif pkt_type < ParamType.FLOAT.value:
             print(f"warn{param_info['parameter_number']}: depreciated param type: {ParamType(pkt_type).name}")
             param_info["chunk"] = CRSFParser.parse_param_value(param_payload, pkt_type)
 
-        if pkt_type == ParamType.FLOAT.value:
-            param_info["chunk"] = CRSFParser.parse_param_float(param_payload)
-
-        if pkt_type == ParamType.TEXT_SELECTION.value:
-            param_info["chunk"] = CRSFParser.parse_param_text_selection(param_payload)
-
-        if pkt_type == ParamType.STRING.value:
-            param_info["chunk"] = CRSFParser.parse_param_string(param_payload)
-
-        if pkt_type == ParamType.FOLDER.value:
-            # Weird issue where the folder has no list of children
-            param_info["chunk"] = CRSFParser.parse_param_folder(param_payload)
-
-        if pkt_type == ParamType.OUT_OF_RANGE.value:
+        elif pkt_type == ParamType.OUT_OF_RANGE.value:
             print(f"Out of range parameter: {param_info['parameter_number']}")
-            return param_info
         return param_info
 
+# Param type -> specific field parser, one lookup per parameter
+# FOLDER: weird issue where the folder has no list of children, handled in the parser
+_PARAM_PARSERS = {
+    ParamType.FLOAT.value: CRSFParser.parse_param_float,
+    ParamType.TEXT_SELECTION.value: CRSFParser.parse_param_text_selection,
+    ParamType.STRING.value: CRSFParser.parse_param_string,
+    ParamType.FOLDER.value: CRSFParser.parse_param_folder,
+}
+
+# CRSF packets, constant so they're built once at import
+# CRSF_FRAMETYPE_DEVICE_PING [sync] [len] [type] [00 = broadcast] [crc8] [0x7F = end]
+_ping = bytearray([0xEE, 0x04, 0x28, 0x00])
+_ping.append(CRSFParser.crc8(_ping) ^ 1 << 1)  # CRC8
+_ping.append(0x7F)
+PING_PACKET = bytes(_ping)
+del _ping
+
+# CRSF_FRAMETYPE_PARAMETER_READ [sync] [len] [type] [dest] [origin] [param] [chunk] [crc8]
+# CRC of the fixed type/dest/origin bytes, param and chunk are folded in per request
+_PARAM_REQ_PREFIX_CRC = CRSFParser.crc8(bytes([0xEE, 0x06, 0x2C, 0xEE, 0xEA]))
+
 class CRSFDevice:
     """CRSF device class"""
     # Note: ELRS TX defaults to 960000 baud, RX defaults to 420000/400000 baud
-    def __init__(self, serial_obj: serial.Serial):
+    def __init__(self, serial_obj: serial.Serial, check_crc: bool = True):
         self.tx_state= ConnectionState.DISCONNECTED
         self.rx_state= ConnectionState.DISCONNECTED
         self.serial = serial_obj
+        # Verify CRC on received frames. Only turn off on a trusted local link,
+        # it's also what catches false sync bytes in the RX stream.
+        self.check_crc = check_crc
         self.last_tx = 0
         # Reduce timeout to allow faster serial transmissions (smaller = faster)
         # Be cautious: some devices/drivers may not handle extremely high rates.
@@ -344,11 +359,6 @@ class CRSFDevice:
         # 100% throttle is 1811, 0% is 992 1811-992 = 819
         self.max_throttle = int(1811 - (1811-992)*.5)
         self.max_brake = int(992 - (992-172) * .5) # 100% brake is 172, 0% is 992
-        # CRSF packets
-        # CRSF_FRAMETYPE_DEVICE_PING [sync] [len] [type] [00 = broadcast] [crc8] [0x7F = end]
-        self.ping_packet = bytearray([0xEE, 0x04, 0x28, 0x00])
-        self.ping_packet.append(CRSFParser.crc8(self.ping_packet) ^ 1 << 1)  # CRC8
-        self.ping_packet.append(0x7F)
         self.battery_data = {
             'voltage': 0.0,
             'current': 0.0,
@@ -356,8 +366,10 @@ class CRSFDevice:
             'remaining': 0
         }
         self.link_stats = {
-            'last_update': 0
+            'uplink_rssi_1': 0,
+            'uplink_link_quality': 0
         }
+        self._link_last_update = 0.0  # Kept off the dict, checked every update() tick
         self.radio_sync = {'interval': 0, 'phase': 0}
         self.filter_size = 5
 
@@ -370,6 +382,13 @@ class CRSFDevice:
         self.brake_value = 0
         # RX assembly buffer for incremental parsing of serial stream
         self._rx_buffer = bytearray()
+        # Preallocated RC channels frame: [sync] [len] [type] [22 bytes channels] [crc8]
+        self._rc_frame = bytearray(26)
+        self._rc_frame[0:3] = bytes([0xC8, 0x18, 0x16])  # Header: addr, length, type
+        # Preallocated parameter request, param/chunk/crc filled in per request
+        self._param_req = bytearray([0xEE, 0x06, 0x2C, 0xEE, 0xEA, 0x00, 0x00, 0x00])
+        # Persistent zero-copy view of the channel payload, the type byte CRC is precomputed
+        self._rc_payload_view = memoryview(self._rc_frame)[3:25]
 
     def map(self, x, in_min, in_max, out_min, out_max):
         """Map value from one range to another"""
@@ -377,21 +396,22 @@ class CRSFDevice:
 
     def crsf_battery_sensor(self, data):
         """Parse battery telemetry data"""
-        payload = data[3:-1]  # Skip address, length, type, and CRC
-
-        voltage = int.from_bytes(payload[0:2], byteorder='big') / 10.0  # dV to V
-        current = int.from_bytes(payload[2:4], byteorder='big') / 10.0  # dA to A
-        capacity = int.from_bytes(payload[4:7], byteorder='big')        # mAh
-        remaining = payload[7]                                          # %
+        # Skip address, length, type
+        voltage, current, capacity_remaining = _BATTERY_SENSOR.unpack_from(data, 3)
+        voltage /= 10.0                             # dV to V
+        current /= 10.0                             # dA to A
+        capacity = capacity_remaining >> 8          # mAh, top 3 bytes
+        remaining = capacity_remaining & 0xFF
 
         self.battery_data = {
             'voltage': voltage,
             'current': current,
             'capacity': capacity,
-            'remaining': remaining
+            'remaining': remaining                  # %
         }
 
-        print(f"Battery: {voltage:.1f}V {current:.1f}A {capacity}mAh {remaining}%")
+        if DEBUG:
+            print(f"Battery: {voltage:.1f}V {current:.1f}A {capacity}mAh {remaining}%")
 
     def request_link_stats(self):
         """Request link quality stats from CRSF device"""
@@ -404,10 +424,10 @@ class CRSFDevice:
 
     def crsf_link_statistics(self, data):
         """Parse CRSF link statistics"""
-        payload = data[3:-1]  # Skip address, length, type, and CRC
+        payload = _LINK_STATISTICS.unpack_from(data, 3)  # Skip address, length, type
 
+        self._link_last_update = time.monotonic()
         self.link_stats = {
-            'last_update': time.time(),
             'uplink_rssi_1': -payload[0],         # Convert to negative dBm
             'uplink_rssi_2': -payload[1],
             'uplink_link_quality': payload[2],     # Percentage
@@ -436,32 +456,27 @@ class CRSFDevice:
 
         # OPENTX Sync: https://github.com/crsf-wg/crsf/wiki/CRSF_FRAMETYPE_RADIO_ID
 
-        payload = data[5:-1]  # Skip address, length, type, and CRC
-
-        subtype = payload[0]
+        # Skip address, length, type, dest, origin
+        subtype = data[5]
         if subtype == 0x10:  # CRSF_FRAMETYPE_OPENTX_SYNC # CRSFShot
-            interval = int.from_bytes(payload[1:4], byteorder='big') / 10  # us
-            phase = int.from_bytes(payload[5:-1], byteorder='big', signed=True)  # us
-            #interval = payload[1:5]
-            #phase = payload[5:-1]
+            interval, phase = _OPENTX_SYNC.unpack_from(data, 6)
+            interval /= 10  # us
 
             self.radio_sync = {
                 'interval': interval,
                 'phase': phase
             }
-            #print(f"payload: {payload} Radio Sync: {interval}us phase:{phase}")
+            #print(f"Radio Sync: {interval}us phase:{phase}")
         else:
             print(f"Unhandled radio ID subtype: {subtype:02X}")
 
-    def update_rc_channels(self) -> None:
-        """Read and transmit RC channels in CRSF protocol format"""
+    def update_rc_channels(self, now: float) -> None:
+        """Read and transmit RC channels in CRSF protocol format, now is the caller's monotonic tick"""
         # Frame: [0xEE, length, type, payload..., crc8]
         # RC packet type = 0x16
         # 16 channels * 11 bits = 22 bytes of payload
         # Total frame length = 24 bytes (22 payload + 2 header)
 
-        packet = bytearray([0xC8, 0x18, 0x16])  # Header: addr, length, type
-
         # Pack 16 channels of 11-bit values into 22 bytes
         # Each channel should be between 172 and 1811 for CRSF protocol
         #channels = [992] * 16  # Default to mid-position (172-1811 range)
@@ -474,12 +489,9 @@ class CRSFDevice:
         # A payload length 0x19 indicates the last byte contains information to trigger
         # armed behavior (0=disarmed, 1=armed). ExpressLRS >=4.0.0 / EdgeTX v2.11.
 
-        buffer = 0
-        bits_written = 0
-        bytes_written = 0
-
         # Early exit if serial is closed
-        if not self.serial.is_open:
+        ser = self.serial
+        if not ser.is_open:
             return False
 
         # Set CRSF values
@@ -489,32 +501,24 @@ class CRSFDevice:
         else:
             self.rc_channels[1] = self.throttle_value # - brake_crsf  # Throttle + Brake
 
-        if not self.serial.is_open:
-            # Don't bother going further if serial is closed
-            return False
-
-        # Pack 11-bit channel values into bytes
-        for value in self.rc_channels:
-            buffer |= (value << bits_written)
-            bits_written += 11
+        # The layout is fixed (16 * 11 bits = 176 bits = 22 bytes), so pack every
+        # channel into one little-endian integer and emit it in a single call
+        ch = self.rc_channels
+        packed = (ch[0] | ch[1] << 11 | ch[2] << 22 | ch[3] << 33 |
+                  ch[4] << 44 | ch[5] << 55 | ch[6] << 66 | ch[7] << 77 |
+                  ch[8] << 88 | ch[9] << 99 | ch[10] << 110 | ch[11] << 121 |
+                  ch[12] << 132 | ch[13] << 143 | ch[14] << 154 | ch[15] << 165)
 
-            # Write full bytes when we have them
-            while bits_written >= 8:
-                packet.append(buffer & 0xFF)
-                buffer >>= 8
-                bits_written -= 8
-                bytes_written += 1
+        # Reuse the preallocated frame, header is already in place
+        packet = self._rc_frame
+        packet[3:25] = (packed & _RC_PAYLOAD_MASK).to_bytes(22, 'little')
 
-        # Write remaining bits if any
-        if bits_written > 0:
-            packet.append(buffer & 0xFF)
-
-        # Add CRC
-        packet.append(CRSFParser.crc8(packet))
+        # Add CRC in place, no per-frame allocations
+        packet[25] = CRSFParser.crc8_update(_RC_TYPE_CRC, self._rc_payload_view)
 
         # Send frame
-        self.serial.write(packet)
-        self.last_tx = time.time()
+        ser.write(packet)
+        self.last_tx = now
 
         #print("TXRC:" + " ".join([f"{b:02X}" for b in packet]))
 
@@ -525,10 +529,14 @@ class CRSFDevice:
         if chunk_idx < 0:
             print("Invalid chunk index: ", chunk_idx)
             chunk_idx = 0
-        packet = bytearray([0xEE, 0x06, 0x2C, 0xEE, 0xEA, param_idx, chunk_idx])
-        packet.append(CRSFParser.crc8(packet))
+        # Only the last two payload bytes change, so finish the cached header CRC
+        # with two table lookups instead of a full crc8 pass
+        packet = self._param_req
+        packet[5] = param_idx
+        packet[6] = chunk_idx
+        packet[7] = _CRC8_D5[_CRC8_D5[_PARAM_REQ_PREFIX_CRC ^ param_idx] ^ chunk_idx]
         self.serial.write(packet)
-        self.last_tx = time.time()
+        self.last_tx = time.monotonic()
         #print(f"TX: Requesting param {param_idx} chunk {chunk_idx}:{' '.join([f'{b:02X}' for b in packet])}")
 
     def request_elrs_status(self):
@@ -536,7 +544,7 @@ class CRSFDevice:
         packet = bytearray([0x00, 0x06, 0x2D, 0x2E, 0x00])
         packet.append(CRSFParser.crc8(packet))
         self.serial.write(packet)
-        self.last_tx = time.time()
+        self.last_tx = time.monotonic()
         print("Requested ELRS status")
 
     def crsf_parameter_settings(self, raw_param_data):
@@ -558,30 +566,31 @@ class CRSFDevice:
         if param_num not in self.param_buff:
             self.param_buff[param_num] = {
                 'total_chunks': chunk_index + 1,
-                'chunks': [None] * (chunk_index + 1)
+                'chunks': [None] * (chunk_index + 1),
+                'missing': set(range(chunk_index + 1))
             }
 
         # Easy reference the current param's buffer slot,
         # and load the right chunk into it's own indexed slot
         chunk_store = self.param_buff[param_num]
         if chunk_index < len(chunk_store['chunks']):
-            if chunk_store['chunks'][chunk_index] is not None:
+            if chunk_index not in chunk_store['missing']:
                 print(f"Duplicate chunk {chunk_index} for param {param_num}")
             else:
                 chunk_store['chunks'][chunk_index] = payload_chunk
+                chunk_store['missing'].discard(chunk_index)
         else:
             print(f"Invalid chunk index: {chunk_index} for param {param_num} with {len(chunk_store['chunks'])} chunks")
             return
 
         # Check if all positions have data
-        if all(chunk is not None for chunk in chunk_store['chunks']):
-            combined_data = bytearray()
-            for chunk in reversed(chunk_store['chunks']):
-                combined_data.extend(chunk)
+        if not chunk_store['missing']:
+            # Chunks arrive last-first, join them back in order in one copy
+            chunks = chunk_store['chunks']
+            combined_data = bytearray().join(reversed(chunks))
 
-            # Clear the buffer
-            for i in range(len(self.param_buff[param_num]['chunks'])):
-                self.param_buff[param_num]['chunks'][i] = None
+            # Mark every chunk missing again, stale chunks get overwritten on the next read
+            chunk_store['missing'].update(range(len(chunks)))
 
             try:
                 # Try and parse the parameter into it's own types
@@ -594,7 +603,7 @@ class CRSFDevice:
                 self.parameters[param_num] = param_info
 
                 #print(f"Param {param_num}:\n\t{param_info['chunk_header']['name']} - {self.parameters[param_num]}")
-            except (IndexError, ValueError, TypeError, UnicodeDecodeError) as e:
+            except (IndexError, ValueError, TypeError, UnicodeDecodeError, struct.error) as e:
                 print(f"Error parsing parameter {param_num}: {e}")
                 print(f"Raw buff: {raw_param_data}")
                 self.parameters[param_num] = combined_data
@@ -609,10 +618,21 @@ class CRSFDevice:
         else:
             # Request any missing chunk, but just one at a time
             # (because they might not all be there or in order)
-            for i, chunk in enumerate(reversed(chunk_store['chunks'])):
-                if chunk is None:
-                    self.request_parameter(param_num, i)
-                    break
+            # Stored index counts chunks remaining, so the earliest missing
+            # chunk in sequence is the highest missing index
+            missing_idx = max(chunk_store['missing'])
+            self.request_parameter(param_num, len(chunk_store['chunks']) - 1 - missing_idx)
+
+    def crsf_device_info(self, data: bytearray) -> None:
+        """ Handle device info packet, also the ping response """
+        try:
+            device_info = CRSFParser.parse_device_info(data)
+        except (IndexError, ValueError, struct.error) as e:
+            print(f"Error parsing device info: {e}")
+            return
+        if self.tx_state == ConnectionState.CONNECTING:
+            self.tx_state = ConnectionState.PARAMETERS
+        self.device_info = device_info
 
     def crsf_rc_channels_packed(self, data: bytearray) -> None:
         """ Handle RC channels packet """
@@ -621,10 +641,14 @@ class CRSFDevice:
         # 16 channels * 11 bits = 22 bytes of payload
         # Total frame length = 24 bytes (22 payload + 2 header)
 
-        # Extract channels from payload
-        channels = []
-        for i in range(3, 25, 2):
-            channels.append((data[i] << 8) | data[i + 1])
+        # Channels are only printed, don't unpack them unless debugging
+        if not DEBUG:
+            return
+
+        # Extract channels from payload, the inverse of update_rc_channels:
+        # one little-endian integer holding 16 channels of 11 bits
+        packed = int.from_bytes(data[3:25], 'little')
+        channels = [(packed >> shift) & 0x7FF for shift in _RC_SHIFTS]
 
         print("RXRC:" + " ".join([f"{b:04X}" for b in channels]))
 
@@ -637,18 +661,22 @@ class CRSFDevice:
         # [sync] [len] [type] [[ext dest] [ext src] [payload]] [crc8]
 
         # Read available bytes and append to incremental RX buffer. Then parse complete frames out of the buffer.
+        # Hot path: bind attributes used per byte/frame to locals once
+        ser = self.serial
+        buf = self._rx_buffer
         try:
-            if not self.serial or not self.serial.is_open:
+            if not ser or not ser.is_open:
                 return
 
-            if self.serial.in_waiting < 1:
+            waiting = ser.in_waiting
+            if waiting < 1:
                 return
 
-            raw_data = self.serial.read(self.serial.in_waiting)
+            raw_data = ser.read(waiting)
             if not raw_data:
                 return
             # Append to assembly buffer
-            self._rx_buffer.extend(raw_data)
+            buf.extend(raw_data)
         except serial.SerialException as e:
             print(f"Serial error: {e}")
             return
@@ -657,88 +685,80 @@ class CRSFDevice:
             return
 
         # Now try to extract as many full frames as possible
-        VALID_SYNC = {0x00, 0xEA, 0x0C, 0xC8}
+        crc8 = CRSFParser.crc8
+        check_crc = self.check_crc
+        handlers = self._FRAME_HANDLERS
         while True:
             # Need at least 3 bytes for sync, len, and type
-            if len(self._rx_buffer) < 3:
+            if len(buf) < 3:
                 break
 
             # If first byte isn't a valid sync, drop until we find one
-            if self._rx_buffer[0] not in VALID_SYNC:
+            if buf[0] not in _VALID_SYNC:
                 # Find next possible sync byte
                 idx = None
-                for i in range(1, len(self._rx_buffer)):
-                    if self._rx_buffer[i] in VALID_SYNC:
+                for i in range(1, len(buf)):
+                    if buf[i] in _VALID_SYNC:
                         idx = i
                         break
                 if idx is None:
                     # No sync found, dump whole buffer
-                    print(f"Dropping {len(self._rx_buffer)} bytes of garbage: {' '.join([f'{b:02X}' for b in self._rx_buffer])}")
-                    self._rx_buffer.clear()
+                    print(f"Dropping {len(buf)} bytes of garbage: {buf.hex(' ').upper()}")
+                    buf.clear()
                     break
                 else:
                     # Discard preceding bytes
                     if idx > 0:
-                        print(f"Discarding {idx} bytes before sync: {' '.join([f'{b:02X}' for b in self._rx_buffer[:idx]])}")
-                        del self._rx_buffer[:idx]
+                        print(f"Discarding {idx} bytes before sync: {buf[:idx].hex(' ').upper()}")
+                        del buf[:idx]
                     # continue loop to re-evaluate
                     continue
 
             # Now we have sync at buffer[0]
-            expected_len = self._rx_buffer[1]
+            expected_len = buf[1]
             full_len = expected_len + 2  # frame size includes sync and length bytes
 
+            # Sanity check frame length before waiting on it, a bogus length byte
+            # means this wasn't a real sync so drop it and resync
+            if expected_len < 2 or full_len > 64:
+                print(f"ERR: bad frame length ({full_len}), resyncing")
+                del buf[0]
+                continue
+
             # If we don't yet have the whole frame, wait for more data
-            if len(self._rx_buffer) < full_len:
+            if len(buf) < full_len:
                 break
 
-            # Extract one full frame
-            frame = bytes(self._rx_buffer[:full_len])
-            # Remove from buffer
-            del self._rx_buffer[:full_len]
+            # Extract one full frame, the only copy made per frame
+            data = buf[:full_len]
 
-            # Sanity check frame length
-            if len(frame) > 64:
-                print(f"ERR: frame too long ({len(frame)}), discarding: {' '.join([f'{b:02X}' for b in frame])}")
-                continue
+            # Verify CRC, on mismatch only drop the sync byte so a real frame
+            # behind a false sync isn't thrown away with it
+            if check_crc:
+                crc = crc8(memoryview(data)[:-1])
+                if crc != data[-1]:
+                    print(f"CRC mismatch: {crc:02X} != {data[-1]:02X} -- frame: {data.hex(' ').upper()}")
+                    del buf[0]
+                    continue
 
-            # Verify CRC
-            crc = CRSFParser.crc8(frame[:-1])
-            if crc != frame[-1]:
-                print(f"CRC mismatch: {crc:02X} != {frame[-1]:02X} -- frame: {' '.join([f'{b:02X}' for b in frame])}")
-                continue
+            # Remove from buffer
+            del buf[:full_len]
 
             # We have a validated frame, parse it
-            data = bytearray(frame)
-            if len(data) < 3:
-                print(f"Invalid/short packet after validation: len={len(data)} raw={' '.join([f'{b:02X}' for b in data])}")
-                continue
-
-            if data[2] == 0x08: # CRSF_FRAMETYPE_BATTERY_SENSOR
-                self.crsf_battery_sensor(data)
-                continue
-            if data[2] == 0x14: # CRSF_FRAMETYPE_LINK_STATISTICS
-                self.crsf_link_statistics(data)
-                continue
-            if data[2] == 0x16: # RC_CHANNELS_PACKED
-                self.crsf_rc_channels_packed(data)
-                continue
-
-            # Above 0x27 is extended frametype, different packet format!!!
-            if data[2] == 0x29:  # Device Info, also ping response
-                if self.tx_state == ConnectionState.CONNECTING:
-                    self.tx_state = ConnectionState.PARAMETERS
-                self.device_info = CRSFParser.parse_device_info(data)
-                continue
-            if data[2] == 0x2B:  # Parameter data
-                self.crsf_parameter_settings(data)
-                continue
-            if data[2] == 0x3A: #CRSF_FRAMETYPE_RADIO_ID
-                self.crsf_radio_id(data)
+            handler = handlers.get(data[2])
+            if handler is None:
+                print(f"Unhandled frame type: {data[2]:02X}")
                 continue
+            try:
+                handler(self, data)
+            except (IndexError, ValueError, struct.error) as e:
+                # A frame that passed CRC but is too short for its type, drop it
+                print(f"Malformed frame type {data[2]:02X}: {e}")
 
-            print(f"Unhandled frame type: {data[2]:02X}")
 
+    def next_tx_delay(self) -> float:
+        """Seconds until the next TX slot is due, 0 if it's due now"""
+        return max(0.0, self.last_tx + self.timeout - time.monotonic())
 
     def update(self) -> None:
         """
@@ -747,10 +767,11 @@ class CRSFDevice:
         Handles TX and RX states
 
         """
-        now = time.time()
+        now = time.monotonic()
+        tx_state = self.tx_state
 
         try:
-            if self.tx_state == ConnectionState.CONNECTED and \
+            if tx_state == ConnectionState.CONNECTED and \
                     (not self.serial or not self.serial.is_open):
                 self.tx_state= ConnectionState.DISCONNECTED
                 print("Error: Serial disconnected while connected")
@@ -760,14 +781,14 @@ class CRSFDevice:
             return
 
         if now - self.last_tx > self.timeout:
-            if (self.tx_state == ConnectionState.DISCONNECTED) or \
-                    (self.tx_state == ConnectionState.CONNECTING):
-                self.serial.write(self.ping_packet)
-                #print("TXPing:" + " ".join([f"{b:02X}" for b in self.ping_packet]))
+            if (tx_state == ConnectionState.DISCONNECTED) or \
+                    (tx_state == ConnectionState.CONNECTING):
+                self.serial.write(PING_PACKET)
+                #print("TXPing:" + " ".join([f"{b:02X}" for b in PING_PACKET]))
                 self.tx_state = ConnectionState.CONNECTING
                 self.last_tx = now
 
-            elif self.tx_state == ConnectionState.PARAMETERS:
+            elif tx_state == ConnectionState.PARAMETERS:
                 self.request_parameter(self.param_idx, self.current_chunk)
                 self.last_tx = now
 
@@ -781,27 +802,38 @@ class CRSFDevice:
                     print("All parameters requested, connected")
                     self.tx_state = ConnectionState.CONNECTED
 
-            elif self.tx_state == ConnectionState.CONNECTED:
+            elif tx_state == ConnectionState.CONNECTED:
                 # While TX is connected...
 
                 #if self.rx_state == ConnectionState.CONNECTED:
                     # If we've got an RX connected too
-                if now - self.link_stats['last_update'] > 5: # Haven't gotten an update in 5s
+                if now - self._link_last_update > 5: # Haven't gotten an update in 5s
                     self.request_link_stats()
                     self.request_elrs_status()
-                    self.link_stats['last_update'] = now
+                    self._link_last_update = now
                     self.link_stats['uplink_link_quality'] = 0
                     self.link_stats['uplink_rssi_1'] = 0
                     self.rx_state = ConnectionState.DISCONNECTED
 
                 # Update channels to force server-style connection?
-                if not self.update_rc_channels():
+                if not self.update_rc_channels(now):
                     # If we return false, update the time anyway so we don't loop lag
                     self.last_tx = now
 
         if self.tx_state != ConnectionState.DISCONNECTED:
             self.handle_rx()
 
+    # RX frame type -> handler, looked up once per frame in handle_rx
+    _FRAME_HANDLERS = {
+        0x08: crsf_battery_sensor,      # CRSF_FRAMETYPE_BATTERY_SENSOR
+        0x14: crsf_link_statistics,     # CRSF_FRAMETYPE_LINK_STATISTICS
+        0x16: crsf_rc_channels_packed,  # RC_CHANNELS_PACKED
+        # Above 0x27 is extended frametype, different packet format!!!
+        0x29: crsf_device_info,         # Device Info, also ping response
+        0x2B: crsf_parameter_settings,  # Parameter data
+        0x3A: crsf_radio_id,            # CRSF_FRAMETYPE_RADIO_ID
+    }
+
 if __name__ == "__main__":
     print("Go run the GUI")
     exit()
@@ -19,6 +19,15 @@ from simlink_csrf import CRSFDevice, ConnectionState
 from simlink_input_HID import InputController, GenericHIDDevice
 from simlink_serial import SerialManager
 
+# Raw input ranges from InputController and the CRSF channel center
+STEER_INPUT_MAX = 2560
+PEDAL_INPUT_MAX = 255
+CRSF_CENTER = 992
+# Link label background per link quality percent, red at 0% fading to green at 100%
+LINK_QUALITY_COLORS = tuple(f'#{int((100 - lq) * 2.55):02x}{int(lq * 2.55):02x}00' for lq in range(101))
+# How long each axis is sampled for during calibration
+CALIBRATION_SECONDS = 2.0
+
 class SimLinkGUI:
     """ SimLink CRSF GUI """
     def __init__(self):
@@ -26,15 +35,21 @@ class SimLinkGUI:
         self.script_dir = os.path.dirname(os.path.abspath(__file__))
         self.simlink_json = os.path.join(self.script_dir, "simlink.json")
         self.mappings_json = os.path.join(self.script_dir, "mappings.json")
+        # Parsed mappings.json and the (mtime_ns, size) it was read at
+        self._mappings_cache = None
+        self._mappings_stat = None
 
         self.root = tk.Tk()
         self.root.title('SimLink CRSF TX GUI')
         # Input update rate and last-run timestamp (seconds)
         # Increase input sampling to 100 Hz for faster updates
         self.input_update_interval = 0.01  # 100 Hz
-        self.last_input_update = time.time()
-        self.queue = queue.Queue()
-        self.param_queue = queue.Queue()
+        self.last_input_update = time.monotonic()
+        # Newest status strings posted by controller_loop, taken by update_gui
+        self._status_slot = None
+        # Newest decoded parameter list from controller_loop, a single-slot handoff:
+        # each list is a full snapshot so the GUI only ever needs the latest one
+        self._latest_params = None
         # Pending parameter chunks buffer and throttle settings
         self._pending_param_chunks = []
         self._last_params_update = 0.0
@@ -43,14 +58,28 @@ class SimLinkGUI:
         self.crsf_tx = None
         self.serial_manager = SerialManager()
         self.tx_queue = queue.Queue()  # Queue for passing values to the thread
-        self.steer_val_disp = tk.StringVar(value='Steering: --')
-        self.throttle_val_disp = tk.StringVar(value='Throttle: --')
-        self.brake_val_disp = tk.StringVar(value='   Brake: --')
         self.serial_status = tk.StringVar(value='PC->TX Link: Disconnected')
         self.conn_status = tk.StringVar(value='TX->RX: N/A')
         self.battery_var = tk.StringVar(value='Battery: --')
         self.link_var = tk.StringVar(value='Link: --')
+        # Last text pushed to each Tk variable, so unchanged values skip the Tk call
+        self._shown = {}
+        self._link_color = None
+        # Battery and link values last formatted into their labels
+        self._batt_shown = None
+        self._link_shown = None
+        # CRSF values the channel labels last showed
+        self._values_shown = None
+        # Inputs the charts were last drawn with, None forces a redraw
+        self._charts_shown = None
+        # Canvas -> (width, height), kept current by <Configure> instead of winfo calls per frame
+        self._chart_sizes = {}
+        # Newest unapplied value per limit slider, see _schedule_slider
+        self._slider_pending = {}
         self._port_map = {}
+        self._port_scan = None  # Latest comports() result, taken by check_serial_status
+        self._ports_key = None  # (device, description) of the listed ports
+        self._settings_snapshot = None  # Sorted JSON of the gui settings last loaded or saved
 
         # Initialize InputController
         self.input_controller = InputController()
@@ -87,6 +116,18 @@ class SimLinkGUI:
         self.update_thread.daemon = True
         self.update_thread.start()
 
+        # HID enumeration can block for a long time on some hosts, keep it off the Tk thread
+        self._hid_scan = None  # Latest hid.enumerate() result, taken by check_hid_devices
+        self._hid_key_set = set()  # (product, vid, pid) of the listed devices
+        self._hid_device_list = None  # Descriptions currently in the device comboboxes
+        self.hid_scan_thread = threading.Thread(target=self.hid_scan_loop)
+        self.hid_scan_thread.daemon = True
+        self.hid_scan_thread.start()
+        # Same for serial ports, comports() goes through WMI on Windows
+        self.port_scan_thread = threading.Thread(target=self.port_scan_loop)
+        self.port_scan_thread.daemon = True
+        self.port_scan_thread.start()
+
         # Start periodic serial status check
         self.check_serial_status()
 
@@ -145,9 +186,13 @@ class SimLinkGUI:
         # Create a new frame for throttle and brake labels to stack them vertically
         values_inner_frame = ttk.Frame(values_frame)
         values_inner_frame.pack(fill='x', pady=2)
-        ttk.Label(values_inner_frame, textvariable=self.steer_val_disp).pack(fill='x', pady=2, padx=5)
-        ttk.Label(values_inner_frame, textvariable=self.throttle_val_disp).pack(fill='x', pady=2, padx=5)
-        ttk.Label(values_inner_frame, textvariable=self.brake_val_disp).pack(fill='x', pady=2, padx=5)
+        # Plain labels set with config(), no StringVar traces on every update
+        self.steer_val_label = ttk.Label(values_inner_frame, text='Steering: --')
+        self.steer_val_label.pack(fill='x', pady=2, padx=5)
+        self.throttle_val_label = ttk.Label(values_inner_frame, text='Throttle: --')
+        self.throttle_val_label.pack(fill='x', pady=2, padx=5)
+        self.brake_val_label = ttk.Label(values_inner_frame, text='   Brake: --')
+        self.brake_val_label.pack(fill='x', pady=2, padx=5)
 
         # Parameters frame
         self.params_frame = ttk.LabelFrame(right_container, text="ELRS Parameters")
@@ -268,24 +313,41 @@ class SimLinkGUI:
         self.steering_chart = tk.Canvas(steering_frame, width=200, height=20, bg='white')
         self.steering_chart.pack(side='left', fill='x', expand=True, padx=5)
 
+        # Chart items are created once and moved with coords()/itemconfig() on update,
+        # in draw order: center line, bar, then the value text on top
+        self._throttle_bar = self.throttle_chart.create_rectangle(0, 0, 0, 0, fill='green', outline='')
+        self._throttle_text = self.throttle_chart.create_text(0, 0, anchor='e', fill='black')
+        self._brake_bar = self.brake_chart.create_rectangle(0, 0, 0, 0, fill='red', outline='')
+        self._brake_text = self.brake_chart.create_text(0, 0, anchor='e', fill='black')
+        self._steering_center = self.steering_chart.create_line(0, 0, 0, 0, fill='black', dash=(2, 4))
+        self._steering_bar = self.steering_chart.create_rectangle(0, 0, 0, 0, fill='blue', outline='')
+        self._steering_text = self.steering_chart.create_text(0, 0, anchor='e', fill='black')
+
+        # Charts only redraw when inputs change, or when a resize invalidates them
+        for chart in (self.throttle_chart, self.brake_chart, self.steering_chart):
+            chart.bind('<Configure>', self._on_chart_configure)
+
     # Parameters are always visible now; hide/show removed
 
-    def refresh_ports(self):
-        """Refresh available COM ports with descriptions"""
-        # Get list of (port, description) tuples from serial_manager
-        ports = self.serial_manager.get_available_ports()
+    def refresh_ports(self, port_list=None):
+        """
+        Refresh available COM ports with descriptions
+        Pass port_list to reuse a comports() scan already done off the Tk thread.
+        """
         # Try to get descriptions if available
         try:
-            # If your SerialManager returns a list of serial.tools.list_ports.ListPortInfo objects:
-            port_list = list(serial.tools.list_ports.comports())
-            port_display = [f"{p.device} - {p.description}" for p in port_list]
-            port_values = [p.device for p in port_list]
+            if port_list is None:
+                port_list = serial.tools.list_ports.comports()
+            self._ports_key = [(p.device, p.description) for p in port_list]
+            # Display string -> device, saved for later use; keys keep the port order
+            self._port_map = {f"{device} - {description}": device for device, description in self._ports_key}
+            port_display = list(self._port_map)
             self.port_combo['values'] = port_display
             if port_display:
                 self.port_combo.set(port_display[0])
-            self._port_map = dict(zip(port_display, port_values))  # Save mapping for later use
         except (OSError, ValueError, AttributeError):
             # Fallback: just show port names
+            ports = self.serial_manager.get_available_ports()
             self.port_combo['values'] = ports
             if ports:
                 self.port_combo.set(ports[0])
@@ -293,8 +355,12 @@ class SimLinkGUI:
 
     def check_serial_status(self):
         """Check if device still connected"""
-        if self.serial_manager.has_new_ports():
-            self.refresh_ports()
+        # Apply the background port scan only when the ports actually changed
+        port_list = self._port_scan
+        if port_list is not None:
+            self._port_scan = None
+            if [(p.device, p.description) for p in port_list] != self._ports_key:
+                self.refresh_ports(port_list)
 
         # Ensure the Connect/Disconnect button reflects actual connection state
         try:
@@ -307,7 +373,7 @@ class SimLinkGUI:
             self.connect_btn['text'] = 'Disconnect'
         else:
             self.connect_btn['text'] = 'Connect'
-            self.serial_status.set('PC->TX Link: Disconnected')
+            self._set_var(self.serial_status, 'PC->TX Link: Disconnected')
 
         # If we previously had a CRSF device but the serial connection dropped, clear it
         if self.crsf_tx and not connected:
@@ -330,13 +396,25 @@ class SimLinkGUI:
                     self.connect_btn['text'] = 'Disconnect'
             except (OSError, serial.SerialException) as e:
                 # Catch OS and serial-specific errors only to avoid swallowing unexpected exceptions
-                self.serial_status.set(f'USB TX Error: {str(e)}')
+                self._set_var(self.serial_status, f'USB TX Error: {str(e)}')
                 print(f"USB Error: {e}")
         else:
             self.serial_manager.disconnect()
             self.crsf_tx = None
             self.connect_btn['text'] = 'Connect'
-            self.serial_status.set('PC->TX Link: Disconnected')
+            self._set_var(self.serial_status, 'PC->TX Link: Disconnected')
+
+    def _set_var(self, var, value):
+        """Set a Tk variable only when its text changed"""
+        name = str(var)
+        if self._shown.get(name) != value:
+            self._shown[name] = value
+            var.set(value)
+
+    def _on_chart_configure(self, event):
+        """Cache a resized chart's size and force the charts to redraw on the next GUI tick"""
+        self._chart_sizes[event.widget] = (event.width, event.height)
+        self._charts_shown = None
 
     def update_link_color(self, link_quality: int):
         """ Update link quality color """
@@ -345,11 +423,10 @@ class SimLinkGUI:
         elif link_quality < 0:
             link_quality = 0
 
-        red = int((100 - link_quality) * 2.55)
-        green = int(link_quality * 2.55)
-        color = f'#{red:02x}{green:02x}00'
-
-        self.link_label.config(bg=color)
+        color = LINK_QUALITY_COLORS[int(link_quality)]
+        if color != self._link_color:
+            self._link_color = color
+            self.link_label.config(bg=color)
 
     def update_parameters_display(self, param):
         """ Update parameters display """
@@ -378,6 +455,7 @@ class SimLinkGUI:
                     try:
                         if 'value' in pw and pw['value'] is not None:
                             pw['value'].config(text='--')
+                            pw.pop('shown', None)
                     except Exception:
                         pass
                 self.params_clear_on_next = False
@@ -405,10 +483,10 @@ class SimLinkGUI:
         # parenthetical suffix from the incoming name.
         static_name = self.param_defs.get(pnum, {}).get('name')
         if static_name:
-            widgets['label'].config(text=f"{pnum}: {static_name}")
+            label_text = f"{pnum}: {static_name}"
         else:
             display_name = name.partition(' (')[0].strip()
-            widgets['label'].config(text=f"{pnum}: {display_name}")
+            label_text = f"{pnum}: {display_name}"
         # Update the value label (no dropdowns)
         value_label = widgets.get('value')
         options = chunk.get('options') if isinstance(chunk.get('options'), (list, tuple)) else None
@@ -424,6 +502,14 @@ class SimLinkGUI:
         else:
             val = chunk.get('value', '')
             display_val = str(val)
+
+        # Every refresh re-posts all parameters, skip rows already showing this text
+        shown = (label_text, display_val)
+        if widgets.get('shown') == shown:
+            return
+        widgets['shown'] = shown
+
+        widgets['label'].config(text=label_text)
         try:
             if value_label:
                 value_label.config(text=display_val)
@@ -471,7 +557,27 @@ class SimLinkGUI:
 
     # Note: These only cap the OUTPUT value
     #  it should use the inputs full range
+    def _schedule_slider(self, key, apply, value):
+        """Keep the newest slider value and apply it at most every 50ms instead of per pixel dragged"""
+        pending = self._slider_pending
+        first = key not in pending
+        pending[key] = value
+        if first:
+            self.root.after(50, lambda: apply(pending.pop(key)))
+
     def update_max_throttle(self, value):
+        """ Max throttle slider callback """
+        self._schedule_slider('throttle', self._apply_max_throttle, value)
+
+    def update_max_brake(self, value):
+        """ Max brake slider callback """
+        self._schedule_slider('brake', self._apply_max_brake, value)
+
+    def update_max_steer(self, value):
+        """ Max steering slider callback """
+        self._schedule_slider('steer', self._apply_max_steer, value)
+
+    def _apply_max_throttle(self, value):
         """ Update max throttle value """
         if self.crsf_tx:
             throttle_range = 1811 - 992 # Max to Min
@@ -479,7 +585,7 @@ class SimLinkGUI:
             print(f"Set max throttle to {self.crsf_tx.max_throttle}")
         self.throttle_value_label.config(text=f"{int(float(value))}%")
 
-    def update_max_brake(self, value):
+    def _apply_max_brake(self, value):
         """ Update max brake value """
         if self.crsf_tx:
             brake_range = 992 - 172
@@ -487,7 +593,7 @@ class SimLinkGUI:
             print(f"Set max brake to {self.crsf_tx.max_brake}")
         self.brake_value_label.config(text=f"{int(float(value))}%")
 
-    def update_max_steer(self, value):
+    def _apply_max_steer(self, value):
         """ Update max steering value """
         if self.input_controller:
             steer_range = 2560 // 2
@@ -498,32 +604,25 @@ class SimLinkGUI:
 
     def update_gui(self):
         """
-        Main UI update loop runs in foreground, calls itself every 100ms
+        Main UI update loop runs in foreground, calls itself every ~16ms
+        Widgets are only touched when the value behind them changed
         """
 
-        # Check for new data in queue
-        try:
-            q_data = self.queue.get(block=False)
-            if q_data and 'update_status' in q_data:
-                self.conn_status.set(q_data[1]['status'])
-                self.battery_var.set(q_data[1]['battery'])
-                self.link_var.set(q_data[1]['link'])
-        except queue.Empty:
-            pass
-
-        # Collect any incoming parameter chunks but throttle UI updates
-        try:
-            while True:
-                p_data = self.param_queue.get(block=False)
-                if p_data:
-                    # p_data is a list of param dicts
-                    for p in p_data:
-                        if p is not None:
-                            self._pending_param_chunks.append(p)
-                else:
-                    break
-        except queue.Empty:
-            pass
+        # Check for a status posted by the controller thread
+        status = self._status_slot
+        if status is not None:
+            self._status_slot = None
+            self._set_var(self.conn_status, status['status'])
+            self._set_var(self.battery_var, status['battery'])
+            self._set_var(self.link_var, status['link'])
+            self._batt_shown = self._link_shown = None
+
+        # Take the newest parameter snapshot but throttle UI updates
+        p_data = self._latest_params
+        if p_data is not None:
+            self._latest_params = None
+            # p_data is a list of param dicts, superseding any snapshot not yet shown
+            self._pending_param_chunks = [p for p in p_data if p is not None]
 
         # Process pending parameter chunks at most once per param_update_interval
         now = time.time()
@@ -550,137 +649,163 @@ class SimLinkGUI:
         # Update RX Status
         if self.crsf_tx is not None:
             # Update TX Status
-            self.serial_status.set(f"PC->TX Link: {self.crsf_tx.tx_state.name}")
+            self._set_var(self.serial_status, f"PC->TX Link: {self.crsf_tx.tx_state.name}")
 
             # Update RX Status
-            self.conn_status.set(f'TX->RX: {self.crsf_tx.rx_state.name}')
+            self._set_var(self.conn_status, f'TX->RX: {self.crsf_tx.rx_state.name}')
 
-            # Update battery
+            # Update battery, only format the text when the values behind it changed
             batt = self.crsf_tx.battery_data
-            self.battery_var.set(
-                    f'Battery: {batt["voltage"]:.1f}V {batt["current"]:.1f}A {batt["remaining"]}%'
-                )
+            batt_key = (batt["voltage"], batt["current"], batt["remaining"])
+            if batt_key != self._batt_shown:
+                self._batt_shown = batt_key
+                self._set_var(
+                        self.battery_var,
+                        f'Battery: {batt_key[0]:.1f}V {batt_key[1]:.1f}A {batt_key[2]}%'
+                    )
 
             # Update link quality
             stats = self.crsf_tx.link_stats
             if stats:
-                self.link_var.set(
-                    f'Link: RSSI:{stats.get("uplink_rssi_1",0)}dBm LQ:{stats.get("uplink_link_quality",0)}%'
-                )
-                # Update link quality color
                 lq = stats.get("uplink_link_quality", 0)
-                self.update_link_color(lq)
+                link_key = (stats.get("uplink_rssi_1", 0), lq)
+                if link_key != self._link_shown:
+                    self._link_shown = link_key
+                    self._set_var(self.link_var, f'Link: RSSI:{link_key[0]}dBm LQ:{lq}%')
+                    # Update link quality color
+                    self.update_link_color(lq)
 
             # Update CRSFShot data - Unused
             # https://github.com/crsf-wg/crsf/wiki/CRSF_FRAMETYPE_RADIO_ID
             # radio_data = self.crsf_tx.radio_sync
-
-            # Update inputs display
-            self.update_input_display()
-
         else:
-            self.serial_status.set('PC->TX Link: Disconnected')
-            self.conn_status.set('TX->RX: N/A')
-            self.battery_var.set('Battery: --')
-            self.link_var.set('Link: --')
+            self._set_var(self.serial_status, 'PC->TX Link: Disconnected')
+            self._set_var(self.conn_status, 'TX->RX: N/A')
+            self._set_var(self.battery_var, 'Battery: --')
+            self._set_var(self.link_var, 'Link: --')
             self.update_link_color(0)
+            # Placeholders are showing, format the real values again on reconnect
+            self._batt_shown = self._link_shown = None
 
         # Update GUI at ~60 Hz for smoother/ faster UI updates
         self.root.after(16, self.update_gui) # ~16ms -> ~60Hz
 
     def update_input_display(self):
         """ Update input display """
-        if self.crsf_tx is not None:
-            self.steer_val_disp.set(f'St: {self.crsf_tx.steering_value}')
-            self.throttle_val_disp.set(f'Th: {self.crsf_tx.throttle_value}')
-            self.brake_val_disp.set(f'Br: {self.crsf_tx.brake_value}')
-
-        # Update throttle chart
-        self.throttle_chart.delete('all')
-        throttle_val = self.input_controller.throttle_value / 256  # Normalize to 0-1
-        if throttle_val > 0:
-            width = self.throttle_chart.winfo_width() * throttle_val
-            self.throttle_chart.create_rectangle(
-                0, 0, width, self.throttle_chart.winfo_height(),
-                fill='green', outline='')
+        tx = self.crsf_tx
+        if tx is not None:
+            values = (tx.steering_value, tx.throttle_value, tx.brake_value)
+            if values != self._values_shown:
+                self._values_shown = values
+                self.steer_val_label.config(text=f'St: {values[0]}')
+                self.throttle_val_label.config(text=f'Th: {values[1]}')
+                self.brake_val_label.config(text=f'Br: {values[2]}')
+
+        # Skip the chart redraw if nothing it shows has changed
+        ic = self.input_controller
+        charts = (ic.throttle_value, ic.brake_value, ic.steering_value, ic.steering_center_offset)
+        if charts == self._charts_shown:
+            return
+        self._charts_shown = charts
+
+        # Update throttle chart, the bar and text items are created once in init_ui
+        # Unmapped canvases report 1x1, same as winfo_width/height would
+        sizes = self._chart_sizes
+        chart = self.throttle_chart
+        w, h = sizes.get(chart, (1, 1))
+        throttle_val = ic.throttle_value / 256  # Normalize to 0-1
+        chart.coords(self._throttle_bar, 0, 0, w * throttle_val if throttle_val > 0 else 0, h)
         # Draw value at end of bar
-        self.throttle_chart.create_text(
-            self.throttle_chart.winfo_width() - 5, self.throttle_chart.winfo_height() // 2,
-            anchor='e',
-            text=f"{self.input_controller.throttle_value:.0f}",
-            fill='black'
-        )
+        chart.coords(self._throttle_text, w - 5, h // 2)
+        chart.itemconfig(self._throttle_text, text=f"{ic.throttle_value:.0f}")
 
         # Update brake chart
-        self.brake_chart.delete('all')
-        brake_val = self.input_controller.brake_value / 256  # Normalize to 0-1
-        if brake_val > 0:
-            width = self.brake_chart.winfo_width() * brake_val
-            self.brake_chart.create_rectangle(
-                0, 0, width, self.brake_chart.winfo_height(),
-                fill='red', outline='')
+        chart = self.brake_chart
+        w, h = sizes.get(chart, (1, 1))
+        brake_val = ic.brake_value / 256  # Normalize to 0-1
+        chart.coords(self._brake_bar, 0, 0, w * brake_val if brake_val > 0 else 0, h)
         # Draw value at end of bar
-        self.brake_chart.create_text(
-            self.brake_chart.winfo_width() - 5, self.brake_chart.winfo_height() // 2,
-            anchor='e',
-            text=f"{self.input_controller.brake_value:.0f}",
-            fill='black'
-        )
+        chart.coords(self._brake_text, w - 5, h // 2)
+        chart.itemconfig(self._brake_text, text=f"{ic.brake_value:.0f}")
 
         # Update steering chart
-        self.steering_chart.delete('all')
-        steer_val = self.input_controller.steering_value / 2560  # Normalize to 0-1
+        chart = self.steering_chart
+        w, h = sizes.get(chart, (1, 1))
+        steer_val = ic.steering_value / 2560  # Normalize to 0-1
         # Draw center line
-        offset_width = self.steering_chart.winfo_width() * self.input_controller.steering_center_offset
-        center_x = self.steering_chart.winfo_width() / 2 - offset_width
-        self.steering_chart.create_line(
-            center_x, 0, center_x, self.steering_chart.winfo_height(),
-            fill='black', dash=(2, 4))
-        if steer_val > 0:
-            width = self.steering_chart.winfo_width() * steer_val
-            self.steering_chart.create_rectangle(
-                center_x, 0, width, self.steering_chart.winfo_height(),
-                fill='blue', outline='')
+        center_x = w / 2 - w * ic.steering_center_offset
+        chart.coords(self._steering_center, center_x, 0, center_x, h)
+        # Zero width hides the bar, same as not drawing it
+        chart.coords(self._steering_bar, center_x, 0, w * steer_val if steer_val > 0 else center_x, h)
         # Draw value at end of bar
-        self.steering_chart.create_text(
-            self.steering_chart.winfo_width() - 5, self.steering_chart.winfo_height() // 2,
-            anchor='e',
-            text=f"{self.input_controller.steering_value:.0f}",
-            fill='black'
-        )
+        chart.coords(self._steering_text, w - 5, h // 2)
+        chart.itemconfig(self._steering_text, text=f"{ic.steering_value:.0f}")
 
     def check_hid_devices(self):
-        """Periodically check for new HID devices."""
-        # Store current device list
-        current_devices = set(self.hid_device_map.keys()) if hasattr(self, 'hid_device_map') else set()
+        """Periodically check the background scan for new HID devices."""
+        devices = self._hid_scan
+        if devices is not None:
+            self._hid_scan = None
 
-        # Get new device list
-        devices = hid.enumerate()
-        new_device_set = set()
-        for d in devices:
-            desc = f"{d['product_string']} (VID: {hex(d['vendor_id'])}, PID: {hex(d['product_id'])})"
-            new_device_set.add(desc)
+            # Compare the raw fields the descriptions are built from, only format on change
+            new_device_set = {(d['product_string'], d['vendor_id'], d['product_id']) for d in devices}
+
+            # If the device list has changed, refresh
+            if new_device_set != self._hid_key_set:
+                print("HID device list changed, refreshing...")
+                self.refresh_hid_devices(devices)
 
-        # If the device list has changed, refresh
-        if new_device_set != current_devices:
-            print("HID device list changed, refreshing...")
-            self.refresh_hid_devices()
+        # Picking up a finished scan is cheap, check more often than the scan runs
+        self.root.after(500, self.check_hid_devices)
 
-        # Schedule next check in 2 seconds
-        self.root.after(2000, self.check_hid_devices)
+    def hid_scan_loop(self):
+        """
+        HID scan loop runs in background, enumerates devices every 2 seconds
 
-    def refresh_hid_devices(self):
+        Warn: Don't do UI updates here, check_hid_devices applies the result
+        """
+        while self.running:
+            try:
+                self._hid_scan = hid.enumerate()
+            except OSError as e:
+                print(f"HID enumerate failed: {e}")
+            time.sleep(2)
+
+    def port_scan_loop(self):
+        """
+        Serial port scan loop runs in background, enumerates ports every second
+
+        Warn: Don't do UI updates here, check_serial_status applies the result
+        """
+        while self.running:
+            try:
+                self._port_scan = serial.tools.list_ports.comports()
+            except OSError as e:
+                print(f"Serial port scan failed: {e}")
+            time.sleep(1)
+
+    def refresh_hid_devices(self, devices=None):
         """
         Scan and list all HID devices for selection. 
         Auto-register known devices from mappings.json.
+        Pass devices to reuse an enumeration already done off the Tk thread.
         """
-        devices = hid.enumerate()
+        if devices is None:
+            devices = hid.enumerate()
+        self._hid_key_set = {(d['product_string'], d['vendor_id'], d['product_id']) for d in devices}
         device_list = []
         self.hid_device_map = {}
+        self.hid_device_reverse = {}  # (vid, pid) -> first description listed for it
         for d in devices:
             desc = f"{d['product_string']} (VID: {hex(d['vendor_id'])}, PID: {hex(d['product_id'])})"
             device_list.append(desc)
             self.hid_device_map[desc] = (d['vendor_id'], d['product_id'])
+            self.hid_device_reverse.setdefault((d['vendor_id'], d['product_id']), desc)
+
+        # Only rebuild the dropdowns when the list differs, selections are untouched then
+        if device_list == self._hid_device_list:
+            return
+        self._hid_device_list = device_list
 
         # Save current selections
         current_steering = self.steering_device_combo.get()
@@ -689,15 +814,11 @@ class SimLinkGUI:
         self.steering_device_combo['values'] = device_list
         self.throttle_device_combo['values'] = device_list
 
-        # Restore previous selections if they still exist
-        if current_steering in device_list:
-            self.steering_device_combo.set(current_steering)
-        elif device_list:
+        # Restore previous selections if they still exist, otherwise clear them
+        if current_steering not in device_list and device_list:
             self.steering_device_combo.set('')  # Clear selection instead of auto-selecting
 
-        if current_throttle in device_list:
-            self.throttle_device_combo.set(current_throttle)
-        elif device_list:
+        if current_throttle not in device_list and device_list:
             self.throttle_device_combo.set('')  # Clear selection instead of auto-selecting
 
 
@@ -748,88 +869,88 @@ class SimLinkGUI:
         Warn: Don't do UI updates here, do them above
         """
 
+        # Next time the disconnected status is re-sent to the GUI
+        next_status = time.monotonic()
+        # Next time an unexpected (non I/O) error may print its traceback
+        next_error_log = next_status
         while self.running:
-            now = time.time()
+            now = time.monotonic()
+            # Both may be swapped out by the GUI thread, so alias them once per pass
+            ic = self.input_controller
+            tx = self.crsf_tx
+
             # Rate-limit input updates to configured interval
-            if self.input_controller is not None and (now - self.last_input_update) >= self.input_update_interval:
-                self.input_controller.update_inputs()
+            if ic is not None and (now - self.last_input_update) >= self.input_update_interval:
+                ic.update_inputs()
                 self.last_input_update = now
 
-            if self.crsf_tx is not None:
+            if tx is not None:
                 try:
                     # Update the CRSF device with the new values
-                    if self.input_controller is not None:
+                    if ic is not None:
                         # Map input_controller values to CRSF ranges
-                        steer = self.input_controller.steering_value
-                        throttle = self.input_controller.throttle_value
-                        brake = self.input_controller.brake_value
+                        steer, throttle, brake = ic.steering_value, ic.throttle_value, ic.brake_value
 
-                        # Map to CRSF ranges
+                        # Map to CRSF ranges, same integer math as InputController.map()
+                        # but inlined since every input range starts at 0
                         # 172-1811 is steering with 992 center
-                        steer_crsf = int(self.input_controller.map(steer,\
-                             0, 2560, 992 - self.input_controller.steer_range, 992 + self.input_controller.steer_range))
+                        steer_range = ic.steer_range
+                        steer_crsf = int(steer * (2 * steer_range) // STEER_INPUT_MAX + CRSF_CENTER - steer_range)
 
-                        throttle_crsf = int(self.input_controller.map(throttle, 0, 255, 992, self.crsf_tx.max_throttle))
-                        brake_crsf = int(self.input_controller.map(brake, 0, 255, 992, self.crsf_tx.max_brake))
+                        throttle_crsf = int(throttle * (tx.max_throttle - CRSF_CENTER) // PEDAL_INPUT_MAX + CRSF_CENTER)
+                        brake_crsf = int(brake * (tx.max_brake - CRSF_CENTER) // PEDAL_INPUT_MAX + CRSF_CENTER)
 
-                        self.crsf_tx.steering_value = steer_crsf
-                        self.crsf_tx.throttle_value = throttle_crsf
-                        self.crsf_tx.brake_value = brake_crsf
+                        tx.steering_value = steer_crsf
+                        tx.throttle_value = throttle_crsf
+                        tx.brake_value = brake_crsf
 
                     # Call a read/write/update of the serial device
-                    self.crsf_tx.update()
+                    tx.update()
                     # Decode the parameters
-                    decoded_params = []
-                    for param in self.crsf_tx.parameters.values():
-                        decoded_param = self.decode_param(param)
-                        decoded_params.append(decoded_param)
+                    decode_param = self.decode_param
+                    decoded_params = [decode_param(param) for param in tx.parameters.values()]
 
-                    # Put parameter updates into the queue
-                    while self.param_queue.qsize() > 1:
-                        try:
-                            self.param_queue.get_nowait()
-                        except queue.Empty:
-                            break
+                    # Hand the parameter list to the GUI, replacing any it hasn't taken yet
+                    self._latest_params = decoded_params
 
-                    self.param_queue.put(decoded_params, block=False)
-                    #print(f"tx Param Queue: {self.param_queue.qsize()}")
+                    # Sleep until the next TX slot or input sample is due instead of spinning
+                    delay = min(tx.next_tx_delay(),
+                                self.last_input_update + self.input_update_interval - time.monotonic())
+                    if delay > 0:
+                        time.sleep(delay)
 
-                except queue.Full:
-                    print("Queue full, skipping update")
-
-                except Exception as e:
+                except (serial.SerialException, OSError) as e:
+                    # Only I/O faults drop the device, anything else is logged below and the link kept
                     # Print full traceback for easier debugging of connection issues
                     print("Exception in controller_loop:", e)
                     traceback.print_exc()
                     # Clear CRSF device reference
                     self.crsf_tx = None
-                    # Update UI status safely
-                    try:
-                        self.serial_status.set('PC->TX Link: Disconnected')
-                    except Exception:
-                        pass
-                    # Notify GUI of the error without risking additional exceptions
-                    try:
-                        self.queue.put(('update_status', {
-                            'status': f'USB Error: {str(e)}',
-                            'battery': 'Battery: --',
-                            'link': 'Link: --'
-                        }))
-                    except Exception:
-                        pass
+                    # No Tk calls from this thread: with crsf_tx cleared, update_gui shows
+                    # 'PC->TX Link: Disconnected' itself on its next tick
+                    # Notify GUI of the error, replaces any status it hasn't shown yet
+                    self._status_slot = {
+                        'status': f'USB Error: {str(e)}',
+                        'battery': 'Battery: --',
+                        'link': 'Link: --'
+                    }
+                except Exception:
+                    # A bug, not a link fault: keep the device and the loop running.
+                    # It likely repeats every pass, so print at most one traceback a second
+                    if now >= next_error_log:
+                        next_error_log = now + 1.0
+                        traceback.print_exc()
+                    time.sleep(0.01)
 
             else:
                 # When no CRSF TX is connected, update status less frequently and sleep more to save CPU
-                if time.time() % 1 < 1e-3: # Refresh every second
-                    try:
-                        self.queue.get_nowait()
-                    except queue.Empty:
-                        pass
-                    self.queue.put(('update_status', {
+                if now >= next_status: # Refresh every second
+                    next_status = now + 1.0
+                    self._status_slot = {
                         'status': 'TX Disconnected',
                         'battery': 'Battery: --',
                         'link': 'Link: --'
-                    }))
+                    }
                     # print("No CRSF TX connected")
                 time.sleep(0.02)
 
@@ -850,17 +971,6 @@ class SimLinkGUI:
 
     def save_settings(self):
         """Save GUI settings to simlink.json, preserving mappings and other sections."""
-        # Load existing settings if present
-        try:
-            if os.path.exists(self.simlink_json):
-                with open(self.simlink_json, "r", encoding="utf-8") as f:
-                    output_json = json.load(f)
-            else:
-                output_json = {}
-        except Exception as e:
-            print(f"Failed to load existing settings, starting fresh. Error: {e}")
-            output_json = {}
-
         # Update GUI settings (in a subkey to avoid clobbering mappings)
         gui_settings = self.gui_settings.copy() if hasattr(self, 'gui_settings') else {}
 
@@ -881,10 +991,28 @@ class SimLinkGUI:
         gui_settings["max_steer_scale"] = self.max_steer_scale.get()
         # No params visibility state to save (parameters always visible)
 
+        # Nothing to write when the settings match what load_settings read
+        snapshot = json.dumps(gui_settings, sort_keys=True)
+        if snapshot == self._settings_snapshot:
+            return
+
+        # Load existing settings if present
+        try:
+            if os.path.exists(self.simlink_json):
+                with open(self.simlink_json, "r", encoding="utf-8") as f:
+                    output_json = json.load(f)
+            else:
+                output_json = {}
+        except Exception as e:
+            print(f"Failed to load existing settings, starting fresh. Error: {e}")
+            output_json = {}
+
         output_json["gui"] = gui_settings
 
-        with open(self.simlink_json, "w", encoding="utf-8") as f:
-            json.dump(output_json, f, indent=2)
+        # Encode up front so the file is written in one call
+        data = json.dumps(output_json, indent=2)
+        self._write_file_atomic(self.simlink_json, data)
+        self._settings_snapshot = snapshot
         print(f"Settings saved to {self.simlink_json}")
 
     def load_settings(self):
@@ -896,8 +1024,15 @@ class SimLinkGUI:
                 settings = json.load(f)
             gui_settings = settings.get("gui", settings)  # fallback for old format
             self.gui_settings = gui_settings  # Store loaded settings
+            if "gui" in settings:
+                # Old-format files are left unmatched so the next save rewrites them
+                self._settings_snapshot = json.dumps(gui_settings, sort_keys=True)
+            # Fetch each combobox's values from Tk once
+            steering_values = set(self.steering_device_combo['values'])
+            throttle_values = set(self.throttle_device_combo['values'])
+            port_values = set(self.port_combo['values'])
             # Set values if present
-            if "steering_device" in gui_settings and gui_settings["steering_device"] in self.steering_device_combo['values']:
+            if "steering_device" in gui_settings and gui_settings["steering_device"] in steering_values:
                 self.steering_device_combo.set(gui_settings["steering_device"])
                 self.user_selected_steering = True  # Mark as selected since it came from settings
                 # Register the device to enable it
@@ -905,7 +1040,7 @@ class SimLinkGUI:
                     vid, pid = self.hid_device_map[gui_settings["steering_device"]]
                     self.input_controller.register_device(vid, pid)
                     print(f"Loaded steering device from settings: VID {vid}, PID {pid}")
-            if "throttle_device" in gui_settings and gui_settings["throttle_device"] in self.throttle_device_combo['values']:
+            if "throttle_device" in gui_settings and gui_settings["throttle_device"] in throttle_values:
                 self.throttle_device_combo.set(gui_settings["throttle_device"])
                 self.user_selected_throttle = True  # Mark as selected since it came from settings
                 # Register the device to enable it
@@ -913,7 +1048,7 @@ class SimLinkGUI:
                     vid, pid = self.hid_device_map[gui_settings["throttle_device"]]
                     self.input_controller.register_device(vid, pid)
                     print(f"Loaded throttle/brake device from settings: VID {vid}, PID {pid}")
-            if "com_port" in gui_settings and gui_settings["com_port"] in self.port_combo['values']:
+            if "com_port" in gui_settings and gui_settings["com_port"] in port_values:
                 self.port_combo.set(gui_settings["com_port"])
             if "throttle_scale" in gui_settings:
                 self.throttle_scale.set(gui_settings["throttle_scale"])
@@ -964,9 +1099,13 @@ class SimLinkGUI:
     def has_device_mapping(self, vendor_id, product_id):
         """Check if a device mapping exists in mappings.json."""
         try:
-            with open(self.mappings_json, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            mappings = data.get("mappings", {})
+            st = os.stat(self.mappings_json)
+            stat_key = (st.st_mtime_ns, st.st_size)
+            if stat_key != self._mappings_stat:
+                with open(self.mappings_json, "rb") as f:
+                    self._mappings_cache = json.loads(f.read())
+                self._mappings_stat = stat_key
+            mappings = self._mappings_cache.get("mappings", {})
             vid_key = f"{vendor_id:#x}"
             pid_key = f"{product_id:#x}"
             return vid_key in mappings and pid_key in mappings[vid_key]
@@ -986,11 +1125,7 @@ class SimLinkGUI:
             axes = ['steering', 'throttle', 'brake']
 
         # Get device name from hid_device_map
-        device_name = None
-        for desc, (vid, pid) in self.hid_device_map.items():
-            if vid == vendor_id and pid == product_id:
-                device_name = desc
-                break
+        device_name = self.hid_device_reverse.get((vendor_id, product_id))
 
         mapping = {}
         device = GenericHIDDevice(vendor_id, product_id)
@@ -1000,31 +1135,58 @@ class SimLinkGUI:
             messagebox.showinfo("Calibration",
                                  f"Please move the {axis} control through its full range,\
                                       then click OK.")
-            observed = {}
-            for _ in range(100):  # Sample for a short period
-                data = device.read_data(128)
-                if data:
-                    for i, val in enumerate(data):
-                        if i not in observed:
-                            observed[i] = [val, val]
-                        else:
-                            observed[i][0] = min(observed[i][0], val)
-                            observed[i][1] = max(observed[i][1], val)
+            # Running per-byte extremes, filled in by the sampler thread
+            mins, maxs = [], []
+            stop = threading.Event()
+            sampler = threading.Thread(target=self._sample_axis,
+                                       args=(device, CALIBRATION_SECONDS, mins, maxs, stop),
+                                       daemon=True)
+            sampler.start()
+            # Keep the window responsive while the sampler runs
+            while sampler.is_alive():
+                if not self.running:
+                    stop.set()
                 self.root.update()
-                time.sleep(0.02)
-            # Find the index with the largest range
-            best_index, best_range = None, 0
-            for i, (vmin, vmax) in observed.items():
-                rng = vmax - vmin
-                if rng > best_range:
-                    best_index, best_range = i, rng
-            if best_index is not None:
-                mapping[axis] = {'index': best_index, 'min': observed[best_index][0], 'max': observed[best_index][1]}
+                sampler.join(0.02)
+            # Find the index with the largest range, the first one wins a tie
+            ranges = [vmax - vmin for vmin, vmax in zip(mins, maxs)]
+            best_range = max(ranges, default=0)
+            if best_range > 0:
+                best_index = ranges.index(best_range)
+                mapping[axis] = {'index': best_index, 'min': mins[best_index], 'max': maxs[best_index]}
         device.disconnect()
         # Save mapping to settings
         self.save_device_mapping(vendor_id, product_id, mapping, device_name)
         return mapping
 
+    def _sample_axis(self, device, duration_s, mins, maxs, stop):
+        """Fold every HID report read in duration_s into per-byte mins/maxs (runs off the Tk thread)."""
+        if not device.connected:
+            return  # read_data() would return at once, nothing to sample
+        end = time.monotonic() + duration_s
+        while time.monotonic() < end and not stop.is_set():
+            data = device.read_data(128)
+            if not data:
+                # Empty or failed read, back off so a dead device can't spin the thread
+                time.sleep(0.005)
+                continue
+            seen = len(mins)
+            if len(data) > seen:
+                mins.extend(data[seen:])
+                maxs.extend(data[seen:])
+            # map() stops at the shorter list, so only the reported bytes are touched
+            mins[:len(data)] = map(min, mins, data)
+            maxs[:len(data)] = map(max, maxs, data)
+
+    def _write_file_atomic(self, path, text):
+        """Write text to a temp file beside path, then swap it in so readers never see a partial file."""
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
     def save_device_mapping(self, vendor_id, product_id, mapping, device_name=None):
         """Save mapping to mappings.json.
 
@@ -1035,8 +1197,8 @@ class SimLinkGUI:
             device_name: Optional device name/description to store
         """
         try:
-            with open(self.mappings_json, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(self.mappings_json, "rb") as f:
+                data = json.loads(f.read())
         except (FileNotFoundError, json.JSONDecodeError, IOError) as e:
             print(f"Error loading device mappings: {e}")
             data = {"mappings": {}}
@@ -1055,10 +1217,13 @@ class SimLinkGUI:
             device_entry["name"] = device_name
         device_entry["axes"] = mapping
 
+        if data["mappings"][vid_key].get(pid_key) == device_entry:
+            return  # Already stored as is
         data["mappings"][vid_key][pid_key] = device_entry
 
-        with open(self.mappings_json, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4)
+        text = json.dumps(data, indent=4)
+        self._write_file_atomic(self.mappings_json, text)
+        self._mappings_stat = None  # Re-read on the next has_device_mapping
         print(f"Device mapping saved to {self.mappings_json}")
 
 if __name__ == '__main__':
@@ -2,6 +2,7 @@ import time
 import hid
 import json
 import threading
+from collections import deque
 
 class InputDevice:
     """Base class for input devices."""
@@ -263,11 +264,11 @@ class InputController:
         self.max_throttle = 255
         self.max_brake = 255
 
-        # Rolling buffer for smoothing/filtering
+        # Rolling buffer for smoothing/filtering, oldest sample drops off on append
         self.filter_size = 5
-        self.steering_buffer = [992] * self.filter_size
-        self.throttle_buffer = [0] * self.filter_size
-        self.brake_buffer = [0] * self.filter_size
+        self.steering_buffer = deque([992] * self.filter_size, maxlen=self.filter_size)
+        self.throttle_buffer = deque([0] * self.filter_size, maxlen=self.filter_size)
+        self.brake_buffer = deque([0] * self.filter_size, maxlen=self.filter_size)
 
         # Mapping ranges (adjust as needed)
         self.steer_range = 200 # maximum deviation from center in wheel degrees
@@ -310,9 +311,9 @@ class InputController:
         #print(f"Raw Inputs - Steering: {steering}, Throttle: {throttle}, Brake: {brake}")
 
         # Apply moving average filter to raw values first
-        self.steering_buffer = self.steering_buffer[1:] + [steering]
-        self.throttle_buffer = self.throttle_buffer[1:] + [throttle]
-        self.brake_buffer = self.brake_buffer[1:] + [brake]
+        self.steering_buffer.append(steering)
+        self.throttle_buffer.append(throttle)
+        self.brake_buffer.append(brake)
 
         # Get filtered raw values
         steering_avg = sum(self.steering_buffer) // self.filter_size
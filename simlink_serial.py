@@ -8,7 +8,6 @@ class SerialManager:
     """Serial port manager class"""
     def __init__(self):
         self.serial = None
-        self.last_ports = []
 
     def get_available_ports(self) -> List[str]:
         """Get list of available serial ports"""
@@ -20,11 +19,23 @@ class SerialManager:
             if self.serial:
                 self.disconnect()
             self.serial = serial.Serial(port, baud, timeout=0.01)
+            self._set_low_latency()
             return True
         except serial.SerialException as e:
             print(f"Connection error: {e}")
             return False
 
+    def _set_low_latency(self):
+        """Ask the driver to drop its latency timer (ASYNC_LOW_LATENCY), Linux only"""
+        # pyserial only provides this on posix, FTDI adapters otherwise hold RX for ~16ms
+        set_low_latency = getattr(self.serial, 'set_low_latency_mode', None)
+        if set_low_latency is None:
+            return
+        try:
+            set_low_latency(True)
+        except (ValueError, OSError) as e:
+            print(f"Low latency mode not available: {e}")
+
     def disconnect(self):
         """Disconnect from current port"""
         if self.serial and self.serial.is_open:
@@ -41,14 +52,6 @@ class SerialManager:
         except serial.SerialException:
             return False
 
-    def has_new_ports(self) -> bool:
-        """Check if available ports have changed"""
-        current_ports = self.get_available_ports()
-        if current_ports != self.last_ports:
-            self.last_ports = current_ports
-            return True
-        return False
-
 if __name__ == "__main__":
     print("Go run the GUI")
     exit()